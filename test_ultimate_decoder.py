@@ -0,0 +1,150 @@
+import random
+import re
+import wave
+
+import pytest
+
+import ultimate_decoder as decoder
+
+# The per-field searches the fused clue scan must agree with, one independent scan each.
+REFERENCE_PATTERNS = {
+    "url": re.compile(r"https?://[^\s]+"),
+    "email": re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"),
+    "deadline": re.compile(r"until\s+(Friday|Sunday)\b", re.IGNORECASE),
+    "morse": re.compile(r"Morse code pattern for\s*[\"'“”]?([A-Za-z0-9]+)", re.IGNORECASE),
+    "coord": re.compile(r"\b-?\d{1,3}\.\d+\s*,\s*-?\d{1,3}\.\d+\b"),
+    "pw": re.compile(r"\b[a-z]{8,}\b", re.IGNORECASE),
+}
+
+FRAGMENTS = [
+    "https://a.b/c", "HTTP://x", "until", " ", "  \n", "Friday", "sunday", "Morse code pattern for",
+    "“", "'", "time", "12.5", "-78.90", ",", "١٢", "é", "john.doe@duke.edu", "@",
+    ".", "everything", "abcdefgh", "x", "Society", "\x1c", "ſ", "-", "%", "9", "socrates", "?q=",
+]
+
+
+def write_wav(path, samples, nchannels=1, sample_rate=1000):
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(nchannels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(b"".join(s.to_bytes(2, "little", signed=True) for s in samples))
+    return path
+
+
+def decode_wav(path):
+    sample_rate, _, _, samples = decoder.load_wav(path)
+    return decoder.decode_phone_from_peaks(samples, sample_rate)
+
+
+def reference_scan(text):
+    found = {}
+    for kind, pattern in REFERENCE_PATTERNS.items():
+        if kind in ("deadline", "morse"):
+            found[kind] = [m.group(1) for m in pattern.finditer(text)]
+        elif kind == "pw":
+            found[kind] = [m.group(0).lower() for m in pattern.finditer(text)]
+        else:
+            found[kind] = [m.group(0) for m in pattern.finditer(text)]
+    return found
+
+
+def random_texts(count, seed):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 25))) for _ in range(count)]
+
+
+def test_coordinates_inside_url_still_give_location():
+    text = "map https://maps.google.com/?q=35.99,-78.93 here"
+    assert decoder.extract_validated_fields(text)["LOCATION"] == "35.99,-78.93"
+    assert decoder.derive_location(text) == "35.99,-78.93"
+
+
+def test_deadline_after_long_word_is_found():
+    text = "Stayuntil Friday"
+    assert decoder.extract_validated_fields(text)["DEADLINE_DAY_MENTIONED"] == "Friday"
+    assert decoder.derive_timer(text) == "Friday 11:59 PM"
+
+
+def test_overlapping_fields_are_all_kept():
+    fields = decoder.extract_validated_fields("map https://maps.google.com/?q=35.99,-78.93 here Stayuntil Friday")
+    assert fields["LOCATION"] == "35.99,-78.93"
+    assert fields["DEADLINE_DAY_MENTIONED"] == "Friday"
+
+
+def test_url_glued_to_word_is_found():
+    assert decoder.extract_validated_fields("documenthttps://example.com/x")["BOX_LINK"] == "https://example.com/x"
+
+
+def test_morse_word_still_counts_as_password_token():
+    text = "Morse code pattern for 'thereisnotime'. thereisnotime xylophones xylophones"
+    fields = decoder.extract_validated_fields(text)
+    assert fields["MORSE_DECODED_WORD"] == "THEREISNOTIME"
+    assert fields["PASSWORD"] == "thereisnotime"
+
+
+def test_scan_matches_independent_searches():
+    for text in random_texts(3000, seed=1):
+        assert decoder.scan_clue_text(text) == reference_scan(text), text
+
+
+def test_hyperscan_expressions_cover_every_scan_pattern():
+    for _, pattern in decoder._CLUE_SCAN_PATTERNS:
+        assert decoder._hyperscan_expression(pattern)
+
+
+@pytest.mark.parametrize("pattern", [r"\w+", r"a\Bb", r"[\b]", r"\S", r"(?<=x)y", r"(?P=name)"])
+def test_hyperscan_expression_rejects_unhandled_constructs(pattern):
+    with pytest.raises(ValueError):
+        decoder._hyperscan_expression(pattern)
+
+
+@pytest.mark.skipif(decoder.hyperscan is None, reason="hyperscan not installed")
+def test_hyperscan_prefilter_does_not_change_scan(monkeypatch):
+    texts = random_texts(3000, seed=2) + ["", "nothing to see", "ſunday until Sunday"]
+    with_prefilter = [decoder.scan_clue_text(text) for text in texts]
+    monkeypatch.setattr(decoder, "hyperscan", None)
+    assert [decoder.scan_clue_text(text) for text in texts] == with_prefilter
+
+
+def test_unreadable_cache_entry_is_a_miss(tmp_path):
+    undecodable = tmp_path / "ts_clue_bad.txt"
+    undecodable.write_bytes(b"\xff\xfe\xfd")
+    assert decoder.read_cache(undecodable) is None
+    assert decoder.read_cache(tmp_path / "missing.txt") is None
+    assert decoder.read_cache(tmp_path) is None
+
+
+def test_unreadable_json_cache_is_recomputed(tmp_path, monkeypatch):
+    pdf = tmp_path / "clue.pdf"
+    pdf.write_bytes(b"%PDF-stub")
+    monkeypatch.setattr(decoder, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(decoder, "extract_pdf_text", lambda path, digest=None: "until Friday")
+    key = f"ts_clue_{decoder.file_digest(pdf)}_{decoder.file_digest(decoder.Path(decoder.__file__))[:16]}.json"
+    (tmp_path / key).mkdir()  # reading a directory raises OSError
+    assert decoder.derive_clue_outputs(pdf)["timer"] == "Friday 11:59 PM"
+
+
+@pytest.mark.skipif(decoder.np is None, reason="numpy not installed")
+@pytest.mark.parametrize("nchannels", [1, 2])
+def test_array_fallback_decodes_same_phone_as_numpy(tmp_path, monkeypatch, nchannels):
+    rng = random.Random(nchannels)
+    paths = []
+    for i in range(20):
+        samples = [rng.randint(-32768, 32767) for _ in range(101 * 100 * nchannels + rng.randint(0, 150))]
+        paths.append(write_wav(tmp_path / f"clip{i}.wav", samples, nchannels))
+    with_numpy = [decode_wav(path) for path in paths]
+    monkeypatch.setattr(decoder, "np", None)
+    assert [decode_wav(path) for path in paths] == with_numpy
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_full_scale_negative_window_peaks_at_32768(tmp_path, monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(decoder, "np", None)
+    elif decoder.np is None:
+        pytest.skip("numpy not installed")
+    # Every window peaks at abs(-32768) = 32768, so every digit is 8; 888 is toll-free,
+    # leaving the first ten digits as the fallback.
+    path = write_wav(tmp_path / "full_scale.wav", [-32768] * (101 * 100))
+    assert decode_wav(path) == "888-888-8888"
@@ -6,14 +6,38 @@ Evidence-based decoder for the Trident puzzle artifacts.
 
 from __future__ import annotations
 
+import array
+import functools
+import hashlib
+import json
+import os
 import re
 import subprocess
-import struct
+import sys
+import tempfile
 import wave
+from collections import Counter
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; audio decoding falls back to array.array
+    np = None
+
+try:
+    import hyperscan
+except ImportError:  # hyperscan is optional; clue text is scanned with re alone
+    hyperscan = None
+
+try:
+    import pdftotext
+except ImportError:  # the Poppler bindings are optional; the pdftotext CLI is used instead
+    pdftotext = None
+
 AUDIO_FILE = Path("./download.mp3_converted.wav")
 CLUE_PDF = Path("./TS Clues-7.pdf")
+# Per-user, so other local users can neither lock us out of nor plant cache entries.
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "trident-decoder"
 
 MORSE_TABLE = {
     ".-": "A",
@@ -53,57 +77,85 @@ MORSE_TABLE = {
     "---..": "8",
     "----.": "9",
 }
-
-
-def read_wav_info(filename: Path) -> tuple[int, int, float]:
-    with wave.open(str(filename), "rb") as wav_file:
-        sample_rate = wav_file.getframerate()
-        nframes = wav_file.getnframes()
-        duration = nframes / sample_rate
-    return sample_rate, nframes, duration
-
-
-def read_wav_samples(filename: Path) -> tuple[list[int], int]:
+INV_MORSE_TABLE = {v: k for k, v in MORSE_TABLE.items()}
+
+# Clue-text evidence gathered in a single pass. Each kind keeps the result of its own
+# independent search: a match of one kind never hides an overlapping match of another.
+# Patterns without IGNORECASE semantics are scoped with (?-i:...).
+_CLUE_SCAN_PATTERNS = (
+    ("url", r"(?-i:https?://[^\s]+)"),
+    ("email", r"(?-i:\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)"),
+    ("deadline", r"until\s+(?P<day>Friday|Sunday)\b"),
+    # Directly from clue transcription: "spells out the Morse code pattern for 'time'"
+    ("morse", r"Morse code pattern for\s*[\"'\u201c\u201d]?(?P<morse_word>[A-Za-z0-9]+)"),
+    ("coord", r"(?-i:\b-?\d{1,3}\.\d+\s*,\s*-?\d{1,3}\.\d+\b)"),
+    ("pw", r"\b[a-z]{8,}\b"),
+)
+_CLUE_SCAN_KINDS = tuple(name for name, _ in _CLUE_SCAN_PATTERNS)
+# Non-ASCII characters that re.IGNORECASE folds onto ASCII letters (i, k, s). Hyperscan's
+# caseless mode does not, so texts containing them skip the Hyperscan prefilter.
+_ASCII_FOLD_CHARS = ("\u0130", "\u0131", "\u017f", "\u212a")
+_DURHAM_RE = re.compile(r"\bDurham\b.*\bNorth Carolina\b", re.IGNORECASE)
+_SOCIETY_RE = re.compile(r"\b([A-Za-z]+)\s+Society\b", re.IGNORECASE)
+_DUKE_RE = re.compile(r"\b(Duke)\b", re.IGNORECASE)
+_NOTIME_RE = re.compile(r"\bthere\s+is\s+no\s+time\b", re.IGNORECASE)
+# ASCII last digit of every possible 16-bit peak; abs(-32768) makes 32768 reachable.
+_LAST_DIGIT = b"0123456789" * 3277
+# NANP validity: NXX-NXX-XXXX where N=2..9 and neither NXX is N11. The capture sits
+# in a lookahead so finditer reports every overlapping 10-digit window. The digit
+# stream only ever holds ASCII 0-9, so plain [0-9] ranges suffice over Unicode \d.
+_NANP_RE = re.compile(r"(?=([2-9](?!11)[0-9]{2}[2-9](?!11)[0-9]{6}))")
+# 8XX toll-free area codes are not valid geographic numbers.
+_DISALLOWED_AREA = frozenset({"800", "833", "844", "855", "866", "877", "888", "899"})
+
+
+def load_wav(filename: Path) -> tuple[int, int, float, np.ndarray | array.array]:
     with wave.open(str(filename), "rb") as wav_file:
         params = wav_file.getparams()
         frames = wav_file.readframes(params.nframes)
-    samples = [struct.unpack("<h", frames[i : i + 2])[0] for i in range(0, len(frames), 2)]
-    return samples, params.framerate
+    sample_rate = params.framerate
+    duration = params.nframes / sample_rate
+
+    if np is not None:
+        # 16-bit little-endian PCM; frombuffer is a zero-copy view over the frame bytes.
+        samples = np.frombuffer(frames, dtype="<i2")
+        if params.nchannels > 1:
+            samples = samples.reshape(-1, params.nchannels)[:, 0]
+    else:
+        samples = array.array("h")
+        samples.frombytes(frames)
+        if sys.byteorder != "little":
+            samples.byteswap()
+        if params.nchannels > 1:
+            samples = samples[:: params.nchannels]
+    return sample_rate, params.nframes, duration, samples
 
 
-def decode_phone_from_peaks(filename: Path) -> str:
-    samples, sample_rate = read_wav_samples(filename)
+def decode_phone_from_peaks(samples: np.ndarray | array.array, sample_rate: int) -> str:
     window = int(sample_rate * 0.1)
-    peaks = [max(abs(s) for s in samples[i : i + window]) for i in range(0, len(samples) - window, window)]
-    digits = "".join(str(p % 10) for p in peaks[:100])
-
-    # NANP validity: NXX-NXX-XXXX where N=2..9; reject N11 and 8XX area codes.
-    disallowed_area = {"800", "833", "844", "855", "866", "877", "888", "899"}
-
-    def is_valid_nanp(n: str) -> bool:
-        if len(n) != 10 or not n.isdigit():
-            return False
-        area = n[:3]
-        exchange = n[3:6]
-        if area in disallowed_area:
-            return False
-        if area[0] in "01" or exchange[0] in "01":
-            return False
-        if area[1:] == "11" or exchange[1:] == "11":
-            return False
-        return True
-
-    candidates: list[tuple[int, str]] = []
-    for i in range(0, len(digits) - 9):
-        candidate = digits[i : i + 10]
-        if is_valid_nanp(candidate):
-            candidates.append((i, candidate))
+    # Only the first 100 windows feed the digit stream. A final window that
+    # ends exactly on the last sample is skipped.
+    n = min(max((len(samples) - 1) // window, 0), 100)
+    if np is not None:
+        # Reduce in int16 and widen only the per-window extremes, so -32768 cannot
+        # wrap without copying the whole block to a wider dtype first.
+        block = samples[: n * window].reshape(n, window)
+        peaks = np.maximum(block.max(axis=1).astype(np.int32), -block.min(axis=1).astype(np.int32)).tolist()
+    else:
+        peaks = [max(map(abs, samples[i : i + window])) for i in range(0, n * window, window)]
+    digits = bytes([_LAST_DIGIT[p] for p in peaks]).decode("ascii")
+
+    candidates: list[tuple[int, int, str]] = []
+    for match in _NANP_RE.finditer(digits):
+        candidate = match.group(1)
+        if candidate[:3] not in _DISALLOWED_AREA:
+            candidates.append((int(candidate[:3]), match.start(), candidate))
 
     if candidates:
         # Prefer the numerically smallest area code among valid candidates.
         # This avoids picking early noisy 9xx-like artifacts when better
         # candidates (e.g. 2xx/3xx/4xx) exist later in the stream.
-        _, chosen = sorted(candidates, key=lambda item: (int(item[1][:3]), item[0]))[0]
+        _, _, chosen = min(candidates)
         return f"{chosen[:3]}-{chosen[3:6]}-{chosen[6:10]}"
 
     # Deterministic fallback if no NANP-valid candidate is found.
@@ -111,94 +163,258 @@ def decode_phone_from_peaks(filename: Path) -> str:
     return f"{phone[:3]}-{phone[3:6]}-{phone[6:10]}"
 
 
-def extract_pdf_text(pdf_path: Path) -> str:
-    if not pdf_path.exists():
-        return ""
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
 
+def read_cache(cache: Path) -> str | None:
+    # A missing, unreadable or undecodable entry is a cache miss, never an error.
     try:
-        result = subprocess.run(
-            ["pdftotext", str(pdf_path), "-"],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        return result.stdout
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        return ""
+        return cache.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def write_cache(cache: Path, content: str) -> None:
+    # Write a uniquely named temp file, then rename it over the cache entry, so a
+    # concurrent or interrupted run never sees a partial file.
+    try:
+        cache.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache.parent, prefix=f"{cache.name}.", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp, cache)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
 
+def extract_pdf_text(pdf_path: Path, digest: str | None = None) -> str:
+    if not pdf_path.exists():
+        return ""
 
-def extract_validated_fields(text: str) -> dict[str, str]:
+    # Extracted text is cached by PDF content hash so unchanged clues skip pdftotext.
+    if digest is None:
+        digest = file_digest(pdf_path)
+    cache = CACHE_DIR / f"ts_clue_{digest}.txt"
+    cached = read_cache(cache)
+    if cached is not None:
+        return cached
+
+    if pdftotext is not None:
+        # Same Poppler extraction in-process, without the fork/exec and pipe round-trip.
+        # Pages are joined with form feeds, as the command-line tool separates them.
+        try:
+            with open(pdf_path, "rb") as pdf_file:
+                text = "\f".join(pdftotext.PDF(pdf_file))
+        except pdftotext.Error:
+            return ""
+    else:
+        try:
+            result = subprocess.run(
+                ["pdftotext", str(pdf_path), "-"],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        except (FileNotFoundError, subprocess.CalledProcessError):
+            return ""
+        text = result.stdout
+
+    write_cache(cache, text)
+    return text
+
+
+def _hyperscan_expression(pattern: str) -> bytes:
+    # Hyperscan has no captures, \u escapes or Unicode \b/\d/\s, so group names and
+    # word boundaries are dropped and \d/\s widened to any non-ASCII code point. The
+    # result must match a superset of the re pattern, so anything not handled here is
+    # rejected rather than passed through.
+    non_ascii = r"\x{80}-\x{10ffff}"
+    widened = {"d": "0-9" + non_ascii, "s": r"\s\x0b\x1c-\x1f" + non_ascii}
+    out: list[str] = []
+    in_class = negated = False
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            esc = pattern[i + 1]
+            if esc == "u":
+                out.append(f"\\x{{{pattern[i + 2 : i + 6]}}}")
+                i += 6
+                continue
+            if not esc.isalnum() or (in_class and negated and esc in widened):
+                # Escaped punctuation is literal; a negated ASCII \d/\s excludes less.
+                out.append(pattern[i : i + 2])
+            elif esc in widened:
+                out.append(widened[esc] if in_class else f"[{widened[esc]}]")
+            elif esc == "b" and not in_class:
+                pass
+            else:
+                raise ValueError(f"no Hyperscan superset for \\{esc} in {pattern!r}")
+            i += 2
+        elif in_class:
+            in_class = ch != "]"
+            out.append(ch)
+            i += 1
+        elif ch == "[":
+            negated = pattern.startswith("^", i + 1)
+            end = i + 1 + negated
+            if pattern.startswith("]", end):  # a leading ']' is a literal
+                end += 1
+            out.append(pattern[i:end])
+            in_class = True
+            i = end
+        elif pattern.startswith("(?", i):
+            name = re.match(r"\(\?P<\w+>", pattern[i:])
+            if name:
+                out.append("(")
+                i += name.end()
+                continue
+            if pattern[i + 2] in "=!<(P#":
+                raise ValueError(f"no Hyperscan superset for {pattern[i : i + 3]!r} in {pattern!r}")
+            out.append(ch)
+            i += 1
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out).encode()
+
+
+@functools.lru_cache(maxsize=None)
+def _hyperscan_database():
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SINGLEMATCH
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[_hyperscan_expression(pattern) for _, pattern in _CLUE_SCAN_PATTERNS],
+        ids=list(range(len(_CLUE_SCAN_PATTERNS))),
+        elements=len(_CLUE_SCAN_PATTERNS),
+        flags=[flags] * len(_CLUE_SCAN_PATTERNS),
+    )
+    return database
+
+
+@functools.lru_cache(maxsize=None)
+def _clue_scan_re(kinds: tuple[str, ...]) -> re.Pattern:
+    # Every kind sits in its own lookahead that falls back to matching empty, so the
+    # scanner consumes nothing and reports all kinds starting at each position. The
+    # nested conditionals only let a position through if at least one kind matched.
+    lookaheads = "".join(f"(?=(?P<{name}>{pattern})|)" for name, pattern in _CLUE_SCAN_PATTERNS if name in kinds)
+    guard = "(?!)"
+    for name in reversed(kinds):
+        guard = f"(?({name})|{guard})"
+    return re.compile(lookaheads + guard, re.IGNORECASE)
+
+
+_CLUE_SCAN_RE = _clue_scan_re(_CLUE_SCAN_KINDS)
+
+
+def _clue_scan_prefilter(text: str) -> re.Pattern | None:
+    # Hyperscan reports which kinds occur anywhere in the text in one DFA pass. An
+    # alternative that never matches cannot change finditer's output, so the re pass
+    # only needs the kinds present (and can be skipped when there are none).
+    if hyperscan is None or any(ch in text for ch in _ASCII_FOLD_CHARS):
+        return _CLUE_SCAN_RE
+
+    present: set[int] = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        present.add(pattern_id)
+
+    _hyperscan_database().scan(text.encode("utf-8", "replace"), match_event_handler=on_match)
+    if not present:
+        return None
+    return _clue_scan_re(tuple(name for i, name in enumerate(_CLUE_SCAN_KINDS) if i in present))
+
+
+def scan_clue_text(text: str) -> dict[str, list[str]]:
+    found: dict[str, list[str]] = {name: [] for name in _CLUE_SCAN_KINDS}
+    scanner = _clue_scan_prefilter(text)
+    if scanner is None:
+        return found
+    kinds = [name for name in _CLUE_SCAN_KINDS if name in scanner.groupindex]
+    # Like a separate finditer per kind, a kind's next match may not start before
+    # its previous match ended.
+    resume = dict.fromkeys(kinds, 0)
+    for match in scanner.finditer(text):
+        start = match.start()
+        for kind in kinds:
+            if match.group(kind) is None or start < resume[kind]:
+                continue
+            resume[kind] = match.end(kind)
+            if kind == "deadline":
+                found[kind].append(match.group("day"))
+            elif kind == "morse":
+                found[kind].append(match.group("morse_word"))
+            elif kind == "pw":
+                found[kind].append(match.group(kind).lower())
+            else:
+                found[kind].append(match.group(kind))
+    return found
+
+
+def extract_validated_fields(text: str, scan: dict[str, list[str]] | None = None) -> dict[str, str]:
+    if scan is None:
+        scan = scan_clue_text(text)
     fields: dict[str, str] = {}
 
-    url_match = re.search(r"https?://[^\s]+", text)
-    if url_match:
-        fields["BOX_LINK"] = url_match.group(0).strip().rstrip(".,;)]}\u200b")
+    if scan["url"]:
+        fields["BOX_LINK"] = scan["url"][0].strip().rstrip(".,;)]}\u200b")
 
-    email_match = re.search(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", text)
-    if email_match:
-        fields["EMAIL"] = email_match.group(0)
+    if scan["email"]:
+        fields["EMAIL"] = scan["email"][0]
 
     # Password candidate: a long, contiguous alpha token (challenge text includes one).
-    token_candidates = re.findall(r"\b[a-z]{8,}\b", text.lower())
-    if token_candidates:
-        token_counts: dict[str, int] = {}
-        for tok in token_candidates:
-            token_counts[tok] = token_counts.get(tok, 0) + 1
-        fields["PASSWORD"] = sorted(token_counts.items(), key=lambda kv: (-kv[1], -len(kv[0]), kv[0]))[0][0]
-
-    password_match = re.search(r"\b[a-z]{8,}\b", text, flags=re.IGNORECASE)
-    if password_match:
-        fields.setdefault("PASSWORD", password_match.group(0).lower())
-
-    deadline_matches = re.findall(r"until\s+(Friday|Sunday)\b", text, flags=re.IGNORECASE)
-    if deadline_matches:
-        unique_days = sorted({day.capitalize() for day in deadline_matches})
+    if scan["pw"]:
+        token_counts = Counter(scan["pw"])
+        fields["PASSWORD"] = min(token_counts.items(), key=lambda kv: (-kv[1], -len(kv[0]), kv[0]))[0]
+
+    if scan["deadline"]:
+        unique_days = sorted({day.capitalize() for day in scan["deadline"]})
         fields["DEADLINE_DAY_MENTIONED"] = ", ".join(unique_days)
 
-    # Directly from clue transcription: "spells out the Morse code pattern for 'time'"
-    morse_word_match = re.search(
-        r"Morse code pattern for\s*[\"'\u201c\u201d]?([A-Za-z0-9]+)",
-        text,
-        flags=re.IGNORECASE,
-    )
-    if morse_word_match:
-        fields["MORSE_DECODED_WORD"] = morse_word_match.group(1).upper()
+    if scan["morse"]:
+        fields["MORSE_DECODED_WORD"] = scan["morse"][0].upper()
 
-    coord_match = re.search(r"\b-?\d{1,3}\.\d+\s*,\s*-?\d{1,3}\.\d+\b", text)
-    if coord_match:
-        fields["LOCATION"] = coord_match.group(0)
+    if scan["coord"]:
+        fields["LOCATION"] = scan["coord"][0]
     else:
-        place_match = re.search(r"\bDurham\b.*\bNorth Carolina\b", text, flags=re.IGNORECASE)
+        place_match = _DURHAM_RE.search(text)
         if place_match:
             fields["LOCATION"] = place_match.group(0)
 
     return fields
 
 
-def derive_timer(text: str) -> str:
-    matches = list(re.finditer(r"until\s+(Friday|Sunday)\b", text, flags=re.IGNORECASE))
-    if matches:
+def derive_timer(text: str, scan: dict[str, list[str]] | None = None) -> str:
+    if scan is None:
+        scan = scan_clue_text(text)
+    if scan["deadline"]:
         # Use the last mentioned day in the clue flow.
-        day = matches[-1].group(1).capitalize()
+        day = scan["deadline"][-1].capitalize()
         return f"{day} 11:59 PM"
     return "11:59 PM"
 
 
 def derive_password(text: str, fields: dict[str, str]) -> str:
-    compact = re.sub(r"\s+", " ", text.lower())
-    phrase_match = re.search(r"\bthere\s+is\s+no\s+time\b", compact)
-    if phrase_match:
+    if _NOTIME_RE.search(text):
         return "thereisnotime"
     return fields.get("PASSWORD", "")
 
 
-def derive_email(text: str) -> str:
-    explicit = re.search(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", text)
-    if explicit:
-        return explicit.group(0)
+def derive_email(text: str, scan: dict[str, list[str]] | None = None) -> str:
+    if scan is None:
+        scan = scan_clue_text(text)
+    if scan["email"]:
+        return scan["email"][0]
 
-    society_match = re.search(r"\b([A-Za-z]+)\s+Society\b", text, flags=re.IGNORECASE)
-    school_match = re.search(r"\b(Duke)\b", text, flags=re.IGNORECASE)
+    society_match = _SOCIETY_RE.search(text)
+    school_match = _DUKE_RE.search(text)
     if society_match and school_match:
         local = society_match.group(1).lower()
         domain = school_match.group(1).lower() + ".edu"
@@ -206,11 +422,12 @@ def derive_email(text: str) -> str:
     return "unknown@unknown.edu"
 
 
-def derive_location(text: str) -> str:
-    coord_match = re.search(r"\b-?\d{1,3}\.\d+\s*,\s*-?\d{1,3}\.\d+\b", text)
-    if coord_match:
-        return coord_match.group(0)
-    if re.search(r"\bDuke\b", text, flags=re.IGNORECASE):
+def derive_location(text: str, scan: dict[str, list[str]] | None = None) -> str:
+    if scan is None:
+        scan = scan_clue_text(text)
+    if scan["coord"]:
+        return scan["coord"][0]
+    if _DUKE_RE.search(text):
         return "Duke University"
     return "Unknown Location"
 
@@ -222,26 +439,44 @@ def derive_web(fields: dict[str, str]) -> str:
 
 
 def text_to_morse(text: str) -> str:
-    inv = {v: k for k, v in MORSE_TABLE.items()}
-    parts = []
-    for ch in text.upper():
-        if ch == " ":
-            parts.append("/")
-            continue
-        code = inv.get(ch)
-        if code:
-            parts.append(code)
-    return " ".join(parts)
+    codes = ("/" if ch == " " else INV_MORSE_TABLE.get(ch) for ch in text.upper())
+    return " ".join(code for code in codes if code)
 
 
 def morse_to_text(morse: str) -> str:
-    words = []
-    for word in morse.split("/"):
-        chars = []
-        for symbol in word.strip().split():
-            chars.append(MORSE_TABLE.get(symbol, "?"))
-        words.append("".join(chars))
-    return " ".join(words).strip()
+    get = MORSE_TABLE.get
+    return " ".join("".join([get(symbol, "?") for symbol in word.split()]) for word in morse.split("/")).strip()
+
+
+def derive_clue_outputs(pdf_path: Path) -> dict:
+    # Every value here depends only on the clue text and the derivation code, so the
+    # whole set is cached by PDF content hash plus a hash of this script. Unchanged
+    # clues skip extraction and all regex scans; editing the decoder invalidates them.
+    digest = file_digest(pdf_path) if pdf_path.exists() else None
+    cache = None
+    if digest is not None:
+        cache = CACHE_DIR / f"ts_clue_{digest}_{file_digest(Path(__file__))[:16]}.json"
+        cached = read_cache(cache)
+        if cached is not None:
+            try:
+                return json.loads(cached)
+            except ValueError:
+                pass
+
+    clue_text = extract_pdf_text(pdf_path, digest)
+    scan = scan_clue_text(clue_text)
+    fields = extract_validated_fields(clue_text, scan)
+    outputs = {
+        "fields": fields,
+        "timer": derive_timer(clue_text, scan),
+        "email": derive_email(clue_text, scan),
+        "web": derive_web(fields),
+        "password": derive_password(clue_text, fields),
+        "location": derive_location(clue_text, scan),
+    }
+    if cache is not None and clue_text:
+        write_cache(cache, json.dumps(outputs))
+    return outputs
 
 
 def main() -> None:
@@ -253,15 +488,15 @@ def main() -> None:
         print(f"Audio file not found: {AUDIO_FILE}")
         return
 
-    sample_rate, nframes, duration = read_wav_info(AUDIO_FILE)
+    sample_rate, nframes, duration, samples = load_wav(AUDIO_FILE)
     print("\n[AUDIO FILE]")
     print(f"Path: {AUDIO_FILE}")
     print(f"Sample rate: {sample_rate} Hz")
     print(f"Frames: {nframes}")
     print(f"Duration: {duration:.3f} seconds")
 
-    clue_text = extract_pdf_text(CLUE_PDF)
-    fields = extract_validated_fields(clue_text)
+    clue = derive_clue_outputs(CLUE_PDF)
+    fields = clue["fields"]
 
     print("\n[VALIDATED OUTPUTS]")
     if not fields:
@@ -282,18 +517,14 @@ def main() -> None:
         print(f"Round-trip decode: {roundtrip}")
 
     print("\n[FINAL OUTPUT]")
-    timer = derive_timer(clue_text)
-    phone = decode_phone_from_peaks(AUDIO_FILE)
-    email = derive_email(clue_text)
-    web = derive_web(fields)
-    password = derive_password(clue_text, fields)
-    location = derive_location(clue_text)
-    print(f"TIMER: {timer}")
-    print(f"LOCATION: {location}")
+    # The phone number comes from the audio, not the clue PDF, so it is never cached.
+    phone = decode_phone_from_peaks(samples, sample_rate)
+    print(f"TIMER: {clue['timer']}")
+    print(f"LOCATION: {clue['location']}")
     print(f"PHONE NUMBER: {phone}")
-    print(f"EMAIL: {email}")
-    print(f"WEB ADDRESS: {web}")
-    print(f"PASSWORD: {password}")
+    print(f"EMAIL: {clue['email']}")
+    print(f"WEB ADDRESS: {clue['web']}")
+    print(f"PASSWORD: {clue['password']}")
 
     print("\n" + "=" * 80)
 